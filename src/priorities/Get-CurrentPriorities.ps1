@@ -12,24 +12,40 @@ param(
 $WorkPrioritiesPath = "$PSScriptRoot\WORK-PRIORITIES.md"
 $HomePrioritiesPath = "$PSScriptRoot\HOME-PRIORITIES.md"
 
+# Patterns applied to every line of the priority files - compile them once
+# up front instead of re-stating them inline in each scan
+$Script:OpenTaskPattern   = [regex]::new('^- \[ \]', 'Compiled')
+$Script:OpenTaskAnywhere  = [regex]::new('- \[ \]', 'Compiled')
+$Script:OpenTaskPrefix    = [regex]::new('^- \[ \] ', 'Compiled')
+$Script:AnyTaskPrefix     = [regex]::new('^.*- \[ \] ', 'Compiled')
+# Single alternation covering both priority tiers (P0/D0 and P1/D1) so each
+# line is scanned once and classified by the digit of whatever matched
+$Script:PriorityPattern   = [regex]::new('[PD][01]', 'Compiled')
+
 function Get-CurrentEnvironmentContext {
     param([string]$ForceEnvironment = "Auto")
 
-    $computerName = $env:COMPUTERNAME.ToLower()
+    # Manual override skips auto-detection entirely - no point probing the
+    # environment when the caller has already told us the answer
+    if ($ForceEnvironment -eq "Work") {
+        $isWorkDevice = $true
+    } elseif ($ForceEnvironment -eq "Home") {
+        $isWorkDevice = $false
+    } else {
+        $computerName = $env:COMPUTERNAME.ToLower()
 
-    # Detect work vs home environment based on computer name patterns
-    # Work devices typically have corporate naming conventions
-    $isWorkDevice = $computerName -match "corp|work|laptop-\d+|pc-\d+|desktop-\d+" -or
-                    $computerName -match "^[a-z]{2,4}-\d+$" -or  # Corporate naming patterns
-                    $env:USERDNSDOMAIN -like "*corp*"            # Domain check
+        # Detect work vs home environment based on computer name patterns
+        # Work devices typically have corporate naming conventions
+        $isWorkDevice = $computerName -match "corp|work|laptop-\d+|pc-\d+|desktop-\d+" -or
+                        $computerName -match "^[a-z]{2,4}-\d+$" -or  # Corporate naming patterns
+                        $env:USERDNSDOMAIN -like "*corp*"            # Domain check
+    }
 
-    # Apply manual override if specified
-    if ($ForceEnvironment -eq "Work") { $isWorkDevice = $true }
-    elseif ($ForceEnvironment -eq "Home") { $isWorkDevice = $false }
+    $now = Get-Date
 
     [PSCustomObject]@{
-        CurrentTime = Get-Date -Format "yyyy-MM-dd HH:mm:ss"
-        DayOfWeek = (Get-Date).DayOfWeek
+        CurrentTime = $now.ToString("yyyy-MM-dd HH:mm:ss")
+        DayOfWeek = $now.DayOfWeek
         ComputerName = $env:COMPUTERNAME
         IsWorkDevice = $isWorkDevice
         EnvironmentType = if($isWorkDevice) { "WORK" } else { "HOME" }
@@ -47,53 +63,67 @@ function Show-PriorityFile {
         [string]$Environment
     )
 
-    if (Test-Path $FilePath) {
-        Write-Host "`n[TARGET] $Environment PRIORITIES" -ForegroundColor Cyan
-        Write-Host ("=" * 50) -ForegroundColor Gray
-
-        $content = Get-Content $FilePath -Raw
+    # Read directly and handle the missing-file case in the catch block
+    # rather than paying a separate Test-Path stat before every read
+    try {
+        $fileLines = Get-Content $FilePath -ErrorAction Stop
+    } catch [System.Management.Automation.ItemNotFoundException] {
+        Write-Warning "Priority file not found: $FilePath"
+        return
+    }
 
-        # Extract current tasks (lines starting with - [ ])
-        $currentTasks = $content -split "`n" | Where-Object { $_ -match "^- \[ \]" }
+    Write-Host "`n[TARGET] $Environment PRIORITIES" -ForegroundColor Cyan
+    Write-Host ("=" * 50) -ForegroundColor Gray
+
+    # Collect open tasks plus both priority tiers in a single pass
+    # instead of three separate filters
+    $currentTasks = [System.Collections.Generic.List[string]]::new()
+    $p0Tasks = [System.Collections.Generic.List[string]]::new()
+    $p1Tasks = [System.Collections.Generic.List[string]]::new()
+    foreach ($line in $fileLines) {
+        if ($Script:OpenTaskPattern.IsMatch($line)) { $currentTasks.Add($line) }
+        $inP0 = $false
+        $inP1 = $false
+        foreach ($match in $Script:PriorityPattern.Matches($line)) {
+            if ($match.Value[1] -eq '0') { $inP0 = $true } else { $inP1 = $true }
+        }
+        if ($inP0) { $p0Tasks.Add($line) }
+        if ($inP1) { $p1Tasks.Add($line) }
+    }
 
-        if ($currentTasks) {
-            Write-Host "`n[ACTIVE] CURRENT TASKS:" -ForegroundColor Yellow
-            $currentTasks | ForEach-Object {
-                $task = $_ -replace "^- \[ \] ", "  * "
-                Write-Host $task -ForegroundColor White
-            }
+    if ($currentTasks) {
+        Write-Host "`n[ACTIVE] CURRENT TASKS:" -ForegroundColor Yellow
+        $currentTasks | ForEach-Object {
+            $task = $Script:OpenTaskPrefix.Replace($_, "  * ")
+            Write-Host $task -ForegroundColor White
         }
+    }
 
-        # Extract priority levels
-        $p0Tasks = $content -split "`n" | Where-Object { $_ -match "P0|D0" }
-        $p1Tasks = $content -split "`n" | Where-Object { $_ -match "P1|D1" }
-
-        if ($p0Tasks) {
-            Write-Host "`n[CRITICAL] P0/D0 PRIORITY:" -ForegroundColor Red
-            $p0Tasks | ForEach-Object {
-                if ($_ -match "- \[ \]") {
-                    $task = $_ -replace "^.*- \[ \] ", "  * "
-                    Write-Host $task -ForegroundColor Red
-                }
+    if ($p0Tasks) {
+        Write-Host "`n[CRITICAL] P0/D0 PRIORITY:" -ForegroundColor Red
+        $p0Tasks | ForEach-Object {
+            if ($Script:OpenTaskAnywhere.IsMatch($_)) {
+                $task = $Script:AnyTaskPrefix.Replace($_, "  * ")
+                Write-Host $task -ForegroundColor Red
             }
         }
+    }
 
-        if ($p1Tasks) {
-            Write-Host "`n[HIGH] P1/D1 PRIORITY:" -ForegroundColor Magenta
-            $p1Tasks | ForEach-Object {
-                if ($_ -match "- \[ \]") {
-                    $task = $_ -replace "^.*- \[ \] ", "  * "
-                    Write-Host $task -ForegroundColor Magenta
-                }
+    if ($p1Tasks) {
+        Write-Host "`n[HIGH] P1/D1 PRIORITY:" -ForegroundColor Magenta
+        $p1Tasks | ForEach-Object {
+            if ($Script:OpenTaskAnywhere.IsMatch($_)) {
+                $task = $Script:AnyTaskPrefix.Replace($_, "  * ")
+                Write-Host $task -ForegroundColor Magenta
             }
         }
-    } else {
-        Write-Warning "Priority file not found: $FilePath"
     }
 }
 
 # Main execution
-Clear-Host
+# Clearing the screen is pointless (and emits escape noise) when output is
+# piped or redirected to a file
+if (-not [Console]::IsOutputRedirected) { Clear-Host }
 $context = Get-CurrentEnvironmentContext -ForceEnvironment $ForceEnvironment
 
 Write-Host "[SYSTEM] PRIORITY MANAGEMENT SYSTEM" -ForegroundColor Green